@@ -1,64 +1,405 @@
 #!/usr/bin/env python3
 
+import asyncio
+import atexit
+import csv
 import logging
+import multiprocessing
 import os
+import queue
+import sqlite3
 import sys
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import UTC, datetime
-from typing import Annotated, Any
-
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from types import TracebackType
+from typing import Annotated, Any, NamedTuple, TextIO, TypeVar
+from urllib.parse import urlencode
+
+import httpx
+import ijson
+import msgspec
+import numpy as np
+import orjson
 import pandas as pd
-import requests
+import polars as pl
 import typer
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("io_metrics_api_calls.log"), logging.StreamHandler()],
-)
-logger = logging.getLogger(__name__)
+njit: Callable[..., Any] | None
+try:
+    import numba
+
+    njit = numba.njit
+except ImportError:  # numba is an optional accelerator, not a hard dependency
+    njit = None
+
+
+def _setup_logging() -> logging.Logger:
+    """Route log records through a queue so disk writes happen off-thread.
+
+    FileHandler is synchronous and flushes per record; with thousands of
+    API calls that write would sit on the request critical path. A
+    QueueHandler hands records to a background QueueListener thread that
+    owns the real handlers.
+    """
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    file_handler = logging.FileHandler("io_metrics_api_calls.log")
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    queue_handler = QueueHandler(log_queue)
+    # basicConfig assigns its default formatter to handlers that lack one,
+    # and QueueHandler.prepare() bakes that into the record before the
+    # listener's handlers format it again; keep the queued record plain
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    return logging.getLogger(__name__)
+
+
+logger = _setup_logging()
 
 app = typer.Typer(help="Collect IO metrics from Seqera/Tower API")
 
+# Workflows in these states can no longer change, so their API responses
+# are immutable and safe to cache forever
+TERMINAL_STATUSES = frozenset({"SUCCEEDED", "FAILED", "CANCELLED"})
+
+CACHE_PATH = Path.home() / ".cache" / "seqera_io_metrics.sqlite"
+
+# How long to keep responses for workflows that may still be running
+IN_FLIGHT_CACHE_TTL = 60.0
+
+# Largest page size the workflow listing endpoint accepts; bigger pages
+# mean ~10x fewer round trips than the server default
+DEFAULT_PAGE_SIZE = 500
+
+# Transient statuses worth retrying with exponential backoff
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 5
+RETRY_BACKOFF = 0.5
+
+# Below this many per-process metric entries, pickling the payload to a
+# worker process costs more than extracting it inline on the event loop
+EXTRACT_EXECUTOR_THRESHOLD = 1_000
+
+
+class ResponseCache:
+    """Persistent SQLite cache for API responses keyed on URL + query string.
+
+    get/set are blocking and meant to run via asyncio.to_thread so the
+    commit fsync never stalls the event loop; a lock serialises access to
+    the shared connection across those worker threads.
+    """
+
+    def __init__(self, path: Path = CACHE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, payload BLOB NOT NULL, expires_at REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            row: tuple[bytes, float | None] | None = self._conn.execute(
+                "SELECT payload, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            payload, expires_at = row
+            if expires_at is not None and expires_at < time.time():
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            return payload
+
+    def set(self, key: str, payload: bytes, expire_after: float | None) -> None:
+        """Store a payload; expire_after=None means the entry never expires"""
+        expires_at = None if expire_after is None else time.time() + expire_after
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, payload, expires_at),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+StructT = TypeVar("StructT", bound=msgspec.Struct)
+
+
+class MetricStats(msgspec.Struct):
+    """Aggregate statistics block for one metric; only the mean is used"""
+
+    mean: float = 0.0
+
+
+class ProcessMetric(msgspec.Struct):
+    """Per-process entry in the workflow/{id}/metrics response"""
+
+    process: str = ""
+    reads: MetricStats | None = None
+    writes: MetricStats | None = None
+
+
+class WorkflowMetrics(msgspec.Struct):
+    """Payload of the workflow/{id}/metrics endpoint"""
+
+    metrics: list[ProcessMetric] = msgspec.field(default_factory=list)
+
+
+class _AsyncResponseReader:
+    """Adapt an httpx streaming response to the async file API ijson expects"""
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+        self._buffer = b""
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson opens every parse with read(0) to sniff bytes vs str, so
+        # honouring size matters: answering the probe with a real chunk
+        # would drop the start of the body
+        if size == 0:
+            return b""
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += await self._chunks.__anext__()
+            except StopAsyncIteration:
+                break
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
 
 class APIClient:
-    def __init__(self, base_url: str, api_key: str):
+    """Async Tower API client sharing one HTTP session across all requests."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        max_concurrency: int = 32,
+        cache: ResponseCache | None = None,
+    ):
         self.base_url = base_url
-        self.headers = {"Authorization": f"Bearer {api_key}"}
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            # Compressed JSON bodies cut bytes over the wire substantially
+            "Accept-Encoding": "gzip, deflate",
+        }
+        # Bound concurrent requests to stay within API rate limits
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._session: httpx.AsyncClient | None = None
+        self._cache = cache
+
+    async def __aenter__(self) -> "APIClient":
+        # HTTP/2 multiplexes the details + metrics request pairs over a
+        # single TCP/TLS connection instead of opening one per request
+        self._session = httpx.AsyncClient(
+            headers=self.headers,
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=httpx.Timeout(30.0),
+        )
+        return self
 
-    def get(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._session is not None:
+            await self._session.aclose()
+
+    async def _get_bytes(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        use_cache: bool = False,
+        expire_after: float | None = None,
+    ) -> bytes:
+        """Fetch a response body as raw bytes, or b\"\" on any request error"""
+        if self._session is None:
+            raise RuntimeError("APIClient must be used as an async context manager")
         url = f"{self.base_url}/{endpoint}"
+        query = {key: str(value) for key, value in params.items()}
+
+        cache_key = f"{url}?{urlencode(sorted(query.items()))}"
+        if use_cache and self._cache is not None:
+            # SQLite I/O is blocking, so run it on a worker thread rather
+            # than stalling the event loop behind a disk read or commit
+            payload = await asyncio.to_thread(self._cache.get, cache_key)
+            if payload is not None:
+                logger.info("Cache hit for %s", cache_key)
+                return payload
+
         try:
-            logger.info(f"Making GET request to {url} with params {params}")
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            logger.info(f"Response from {url}: {response.status_code}")
-            data: dict[str, Any] = response.json()
-            return data
-        except requests.exceptions.HTTPError as errh:
-            logger.error(f"HTTP Error: {errh}")
-        except requests.exceptions.ConnectionError as errc:
-            logger.error(f"Error Connecting: {errc}")
-        except requests.exceptions.Timeout as errt:
-            logger.error(f"Timeout Error: {errt}")
-        except requests.exceptions.RequestException as err:
-            logger.error(f"Request Exception: {err}")
-        return {}
-
-    def organizations(self) -> dict[str, Any]:
-        return self.get("orgs", {})
-
-    def workspaces(self, org_id: str) -> dict[str, Any]:
-        return self.get(f"orgs/{org_id}/workspaces", {})
-
-    def workflows(
+            async with self._semaphore:
+                # %s-style arguments defer string formatting until a handler
+                # actually wants the record
+                logger.info("Making GET request to %s with params %s", url, query)
+                for attempt in range(MAX_RETRIES):
+                    response = await self._session.get(url, params=query)
+                    # No point backing off after the last attempt; fall
+                    # through to raise_for_status with the final response
+                    if (
+                        response.status_code not in RETRYABLE_STATUS_CODES
+                        or attempt == MAX_RETRIES - 1
+                    ):
+                        break
+                    delay = RETRY_BACKOFF * (2**attempt)
+                    logger.warning(
+                        "Got %s from %s, retrying in %.1fs",
+                        response.status_code,
+                        url,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                response.raise_for_status()
+                logger.info("Response from %s: %s", url, response.status_code)
+                payload = response.content
+                if use_cache and self._cache is not None:
+                    await asyncio.to_thread(
+                        self._cache.set, cache_key, payload, expire_after
+                    )
+                return payload
+        except httpx.HTTPStatusError as errh:
+            logger.error("HTTP Error: %s", errh)
+        except httpx.ConnectError as errc:
+            logger.error("Error Connecting: %s", errc)
+        except httpx.TimeoutException as errt:
+            logger.error("Timeout Error: %s", errt)
+        except httpx.HTTPError as err:
+            logger.error("Request Exception: %s", err)
+        return b""
+
+    async def get(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        use_cache: bool = False,
+        expire_after: float | None = None,
+    ) -> dict[str, Any]:
+        payload = await self._get_bytes(endpoint, params, use_cache, expire_after)
+        if not payload:
+            return {}
+        try:
+            data: dict[str, Any] = orjson.loads(payload)
+        except orjson.JSONDecodeError as err:
+            # A malformed 200 body or corrupt cached payload degrades the
+            # same way as a failed request
+            logger.error("Failed to decode %s response: %s", endpoint, err)
+            return {}
+        return data
+
+    async def get_typed(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        response_type: type[StructT],
+        use_cache: bool = False,
+        expire_after: float | None = None,
+    ) -> StructT:
+        """Decode a response straight into a msgspec Struct.
+
+        Typed decoding skips building intermediate dicts and gives the
+        caller C-level attribute access instead of .get() chains.
+        """
+        payload = await self._get_bytes(endpoint, params, use_cache, expire_after)
+        if not payload:
+            return response_type()
+        try:
+            return msgspec.json.decode(payload, type=response_type)
+        except msgspec.DecodeError as err:
+            logger.error("Failed to decode %s response: %s", endpoint, err)
+            return response_type()
+
+    async def get_stream(
+        self, endpoint: str, params: dict[str, Any], json_path: str
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield items under json_path incrementally as response bytes arrive.
+
+        Unlike get(), the body is never materialized in full: ijson parses
+        each array element as soon as its bytes land, so parsing overlaps
+        with the TCP receive and peak memory stays at one item. Transient
+        statuses are retried with the same backoff policy as _get_bytes;
+        failures after that — including mid-stream ones — propagate to the
+        caller rather than masquerading as end-of-stream.
+        """
+        if self._session is None:
+            raise RuntimeError("APIClient must be used as an async context manager")
+        url = f"{self.base_url}/{endpoint}"
+        query = {key: str(value) for key, value in params.items()}
+        async with self._semaphore:
+            logger.info("Making streaming GET request to %s with params %s", url, query)
+            for attempt in range(MAX_RETRIES):
+                async with self._session.stream("GET", url, params=query) as response:
+                    # Retry decisions happen on the status line, before any
+                    # body bytes are consumed or yielded
+                    if (
+                        response.status_code not in RETRYABLE_STATUS_CODES
+                        or attempt == MAX_RETRIES - 1
+                    ):
+                        response.raise_for_status()
+                        async for item in ijson.items(
+                            _AsyncResponseReader(response), json_path
+                        ):
+                            yield item
+                        return
+                delay = RETRY_BACKOFF * (2**attempt)
+                logger.warning(
+                    "Got %s from %s, retrying in %.1fs",
+                    response.status_code,
+                    url,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+    async def organizations(self) -> dict[str, Any]:
+        return await self.get("orgs", {})
+
+    async def workspaces(self, org_id: str) -> dict[str, Any]:
+        return await self.get(f"orgs/{org_id}/workspaces", {})
+
+    async def workflows(
         self,
         workspace_id: str,
         min_time: str,
         max_time: str,
         user: str | None = None,
         status: str | None = None,
-    ) -> list[dict[str, Any]]:
-        workflows = []
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield matching workflows page by page.
+
+        Streaming keeps memory at O(page size) and lets the caller start
+        processing page N while page N+1 is still being fetched.
+        """
+        # Values above the API maximum would make every page come back
+        # short; clamp rather than silently under-fetch
+        page_size = max(1, min(page_size, DEFAULT_PAGE_SIZE))
         offset = 0
         search_query = f"after:{min_time} before:{max_time}"
 
@@ -73,38 +414,135 @@ class APIClient:
                 "search": search_query,
                 "workspaceId": workspace_id,
                 "offset": offset,
+                "max": page_size,
             }
-            resp = self.get("workflow", params)
-            if not resp:
+            # Parse each page incrementally; only a fully empty page marks
+            # the end of the listing (streaming never sees the totalSize
+            # field). A short page is not trusted as a terminator — it can
+            # also mean a truncated stream — so the next request simply
+            # resumes from the advanced offset.
+            page_count = 0
+            async for workflow in self.get_stream("workflow", params, "workflows.item"):
+                page_count += 1
+                yield workflow
+
+            if page_count == 0:
                 break
 
-            new_workflows = resp.get("workflows", [])
-            workflows.extend(new_workflows)
-
-            if len(workflows) >= resp.get("totalSize", 0) or len(new_workflows) == 0:
-                break
+            offset += page_count
 
-            offset += len(new_workflows)
-
-        return workflows
-
-    def workflow_details(self, workflow_id: str, workspace_id: str) -> dict[str, Any]:
+    async def workflow_details(
+        self, workflow_id: str, workspace_id: str, terminal: bool = False
+    ) -> dict[str, Any]:
         """Get details for a specific workflow"""
         params = {"workspaceId": workspace_id}
-        return self.get(f"workflow/{workflow_id}", params)
+        return await self.get(
+            f"workflow/{workflow_id}",
+            params,
+            use_cache=True,
+            expire_after=None if terminal else IN_FLIGHT_CACHE_TTL,
+        )
 
-    def workflow_metrics(self, workflow_id: str, workspace_id: str) -> dict[str, Any]:
+    async def workflow_metrics(
+        self, workflow_id: str, workspace_id: str, terminal: bool = False
+    ) -> WorkflowMetrics:
         """Get detailed process metrics for a specific workflow"""
         params = {"workspaceId": workspace_id}
-        return self.get(f"workflow/{workflow_id}/metrics", params)
+        return await self.get_typed(
+            f"workflow/{workflow_id}/metrics",
+            params,
+            WorkflowMetrics,
+            use_cache=True,
+            expire_after=None if terminal else IN_FLIGHT_CACHE_TTL,
+        )
+
+
+class ProcessRow(NamedTuple):
+    """One process-level CSV row; tuples avoid per-row dict overhead"""
+
+    workflow_id: str
+    process_name: str
+    read_bytes: float
+    write_bytes: float
+    total_bytes: float
+
+
+SUMMARY_COLUMNS = (
+    "workflow_id",
+    "workflow_name",
+    "status",
+    "user_name",
+    "start_time",
+    "end_time",
+    "total_read_bytes",
+    "total_write_bytes",
+    "total_io_bytes",
+    "organization_name",
+    "workspace_name",
+)
+
+
+class SummaryBuilder:
+    """Accumulate workflow summaries column-wise as workflows complete.
+
+    Appending into per-column lists (structure-of-arrays) instead of
+    keeping one dict per row lets the final DataFrame be assembled
+    column-by-column, skipping the row-wise iteration a list-of-dicts
+    constructor would do.
+    """
+
+    def __init__(self) -> None:
+        self._columns: dict[str, list[Any]] = {col: [] for col in SUMMARY_COLUMNS}
+        self.rows = 0
+
+    def append(self, summary: dict[str, Any]) -> None:
+        columns = self._columns
+        for key, value in summary.items():
+            columns[key].append(value)
+        self.rows += 1
+
+    def to_polars(self) -> pl.DataFrame:
+        return pl.DataFrame(self._columns)
+
+    def to_pandas(self) -> pd.DataFrame:
+        return pd.DataFrame(self._columns)
+
+
+class ProcessMetricsWriter:
+    """Stream process-level metric rows to CSV as each workflow completes.
+
+    Rows are appended incrementally so the full process-level dataset is
+    never held in memory. The output file is only created once the first
+    row arrives.
+    """
+
+    def __init__(self, path: str):
+        self._path = Path(path)
+        self._file: TextIO | None = None
+        self._writer: Any = None
+        self.rows_written = 0
+
+    def write(self, rows: list[ProcessRow]) -> None:
+        if not rows:
+            return
+        if self._writer is None:
+            self._file = self._path.open("w", newline="")
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(ProcessRow._fields)
+        self._writer.writerows(rows)
+        self.rows_written += len(rows)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
 
 
 def extract_io_metrics(
     workflow_details: dict[str, Any],
-    workflow_metrics_data: dict[str, Any],
+    workflow_metrics_data: WorkflowMetrics,
     org_name: str,
     workspace_name: str,
-) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+) -> tuple[dict[str, Any], list[ProcessRow]]:
     """Extract IO metrics from workflow details and metrics responses"""
     workflow_data = workflow_details.get("workflow", {})
     workflow_id = workflow_data.get("id")
@@ -118,39 +556,22 @@ def extract_io_metrics(
     org_name = workflow_details.get("orgName", org_name)
     workspace_name = workflow_details.get("workspaceName", workspace_name)
 
-    total_read_bytes = 0
-    total_write_bytes = 0
-
-    # Extract process-level metrics from the metrics endpoint
-    process_metrics = []
-    metrics_list = workflow_metrics_data.get("metrics", [])
-
-    # Sum up read and write bytes from all processes
-    for process_metric in metrics_list:
-        process_name = process_metric.get("process", "")
-
-        reads_data = process_metric.get("reads", {})
-        process_read_bytes = 0
-        if reads_data is not None:
-            process_read_bytes = reads_data.get("mean", 0)
+    # Extract process-level metrics from the metrics endpoint; list
+    # comprehensions over pre-extracted columns keep the per-process cost
+    # to a handful of bytecode ops, and the msgspec Structs give slot-based
+    # attribute access instead of dict lookups
+    metrics_list = workflow_metrics_data.metrics
+    names = [m.process for m in metrics_list]
+    reads = [m.reads.mean if m.reads else 0.0 for m in metrics_list]
+    writes = [m.writes.mean if m.writes else 0.0 for m in metrics_list]
 
-        writes_data = process_metric.get("writes", {})
-        process_write_bytes = 0
-        if writes_data is not None:
-            process_write_bytes = writes_data.get("mean", 0)
+    total_read_bytes = sum(reads)
+    total_write_bytes = sum(writes)
 
-        total_read_bytes += process_read_bytes
-        total_write_bytes += process_write_bytes
-
-        process_metrics.append(
-            {
-                "workflow_id": workflow_id,
-                "process_name": process_name,
-                "read_bytes": process_read_bytes,
-                "write_bytes": process_write_bytes,
-                "total_bytes": process_read_bytes + process_write_bytes,
-            }
-        )
+    process_metrics = [
+        ProcessRow(workflow_id, name, read_bytes, write_bytes, read_bytes + write_bytes)
+        for name, read_bytes, write_bytes in zip(names, reads, writes, strict=True)
+    ]
 
     total_io_bytes = total_read_bytes + total_write_bytes
 
@@ -175,24 +596,42 @@ def check_env_vars(var_name: str, default: str | None = None) -> str:
     """Get environment variable or default value"""
     value = os.getenv(var_name, default)
     if value is None:
-        logger.error(f"Environment variable {var_name} is not set")
+        logger.error("Environment variable %s is not set", var_name)
         sys.exit(1)
     return value
 
 
+BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def bytes_to_readable(bytes_value: float) -> str:
     """Convert bytes to human-readable format"""
-    if bytes_value == 0:
+    if bytes_value <= 0:
         return "0 B"
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    i = 0
-    while bytes_value >= 1024 and i < len(units) - 1:
-        bytes_value /= 1024
-        i += 1
-    return f"{bytes_value:.2f} {units[i]}"
+    # bit_length // 10 is an O(1) integer log1024, replacing the divide loop
+    i = max(0, min(len(BYTE_UNITS) - 1, (int(bytes_value).bit_length() - 1) // 10))
+    return f"{bytes_value / (1 << (10 * i)):.2f} {BYTE_UNITS[i]}"
+
+
+def bytes_to_readable_batch(values: np.ndarray) -> list[str]:
+    """Convert an array of byte counts to human-readable strings in one pass"""
+    arr = np.asarray(values, dtype=np.float64)
+    idx = np.clip(np.log2(np.maximum(arr, 1.0)) // 10, 0, len(BYTE_UNITS) - 1).astype(
+        np.int64
+    )
+    scaled = arr / (1 << (10 * idx))
+    return [
+        "0 B" if value <= 0 else f"{s:.2f} {BYTE_UNITS[i]}"
+        for value, s, i in zip(arr, scaled, idx, strict=True)
+    ]
+
 
+async def _empty_workflow_metrics() -> WorkflowMetrics:
+    """Stand-in awaitable for runs that skip the metrics endpoint"""
+    return WorkflowMetrics()
 
-def process_workspace(
+
+async def process_workspace(
     client: APIClient,
     workspace_id: str,
     min_time: str,
@@ -201,84 +640,366 @@ def process_workspace(
     status: str | None = None,
     org_name: str = "Unknown",
     workspace_name: str = "Unknown",
-) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    semaphore: asyncio.Semaphore | None = None,
+    process_writer: ProcessMetricsWriter | None = None,
+    summary_builder: SummaryBuilder | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    executor: ProcessPoolExecutor | None = None,
+    fetch_process_metrics: bool = True,
+) -> None:
     """Process a single workspace and collect IO metrics for all matching workflows"""
-    all_workflow_summaries = []
-    all_process_metrics = []
+    # The optional semaphore bounds how many workspaces stream concurrently
+    async with semaphore if semaphore is not None else nullcontext():
+        workflow_ids = []
+        tasks = []
+        # Schedule each workflow's details + metrics fetch as soon as it is
+        # listed, so later pages download while earlier fetches are already
+        # in flight; the client's semaphore bounds actual concurrency
+        async for workflow in client.workflows(
+            workspace_id, min_time, max_time, user, status, page_size
+        ):
+            workflow_data = workflow.get("workflow", {})
+            workflow_id = workflow_data.get("id")
+            # Responses for finished workflows are immutable and cacheable
+            terminal = workflow_data.get("status") in TERMINAL_STATUSES
+            workflow_ids.append(workflow_id)
+            # Summary-only runs skip the expensive metrics round trip and
+            # substitute an empty payload, halving the request count
+            tasks.append(
+                asyncio.gather(
+                    client.workflow_details(workflow_id, workspace_id, terminal),
+                    (
+                        client.workflow_metrics(workflow_id, workspace_id, terminal)
+                        if fetch_process_metrics
+                        else _empty_workflow_metrics()
+                    ),
+                )
+            )
 
-    workflows = client.workflows(workspace_id, min_time, max_time, user, status)
-    logger.info(f"Found {len(workflows)} workflows in workspace {workspace_name}")
+        logger.info(
+            "Found %s workflows in workspace %s", len(workflow_ids), workspace_name
+        )
+        results = await asyncio.gather(*tasks)
+
+        loop = asyncio.get_running_loop()
+        for workflow_id, (workflow_details, workflow_metrics_data) in zip(
+            workflow_ids, results, strict=True
+        ):
+            # A failed metrics fetch decodes to an empty WorkflowMetrics, so
+            # only the details response gates whether the workflow is kept
+            if workflow_details:
+                # On huge tenants the extraction itself becomes CPU-bound;
+                # the optional process pool moves it off the event loop, but
+                # only for payloads big enough to repay the pickling cost
+                if (
+                    executor is not None
+                    and len(workflow_metrics_data.metrics) >= EXTRACT_EXECUTOR_THRESHOLD
+                ):
+                    summary, process_metrics = await loop.run_in_executor(
+                        executor,
+                        extract_io_metrics,
+                        workflow_details,
+                        workflow_metrics_data,
+                        org_name,
+                        workspace_name,
+                    )
+                else:
+                    summary, process_metrics = extract_io_metrics(
+                        workflow_details,
+                        workflow_metrics_data,
+                        org_name,
+                        workspace_name,
+                    )
+                if not fetch_process_metrics:
+                    # Byte totals are unknown, not zero, without the metrics
+                    # payload; keep them null in the summary output
+                    summary["total_read_bytes"] = None
+                    summary["total_write_bytes"] = None
+                    summary["total_io_bytes"] = None
+                if summary_builder is not None:
+                    summary_builder.append(summary)
+                if process_writer is not None:
+                    process_writer.write(process_metrics)
+                logger.info("Collected IO metrics for workflow %s", workflow_id)
+
+
+async def collect_io_metrics(
+    base_url: str,
+    api_key: str,
+    min_time: str,
+    max_time: str,
+    workspace_id: str | None = None,
+    user: str | None = None,
+    status: str | None = None,
+    no_cache: bool = False,
+    process_writer: ProcessMetricsWriter | None = None,
+    summary_builder: SummaryBuilder | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    fetch_process_metrics: bool = True,
+) -> None:
+    """Collect IO metrics across all matching workspaces using one API client"""
+    cache = None if no_cache else ResponseCache()
+    # One pool for the whole run; extract_io_metrics is a top-level function
+    # and msgspec structs pickle cleanly, so workflows fan out per call.
+    # Fork would copy the process while the QueueListener thread holds its
+    # lock, so spawn workers from a clean forkserver instead
+    executor = ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("forkserver"),
+    )
+    try:
+        async with APIClient(base_url, api_key, cache=cache) as client:
+            # If workspace ID is provided, only process that workspace
+            if workspace_id:
+                logger.info("Processing only workspace ID: %s", workspace_id)
+                # We need to find the workspace name and org name; fetch every
+                # org's workspace list concurrently and resolve with one dict
+                # lookup instead of a serial nested scan
+                orgs = (await client.organizations()).get("organizations", [])
+                all_workspaces = await asyncio.gather(
+                    *[client.workspaces(org.get("orgId")) for org in orgs]
+                )
+                lookup = {
+                    workspace.get("id"): (org.get("name"), workspace.get("name"))
+                    for org, workspaces in zip(orgs, all_workspaces, strict=True)
+                    for workspace in workspaces.get("workspaces", [])
+                }
+                org_name, workspace_name = lookup.get(
+                    workspace_id, ("Unknown", "Unknown")
+                )
+
+                await process_workspace(
+                    client,
+                    workspace_id,
+                    min_time,
+                    max_time,
+                    user,
+                    status,
+                    org_name,
+                    workspace_name,
+                    process_writer=process_writer,
+                    summary_builder=summary_builder,
+                    page_size=page_size,
+                    executor=executor,
+                    fetch_process_metrics=fetch_process_metrics,
+                )
+            else:
+                # Collect every (org, workspace) pair first, then fan the
+                # workspaces out concurrently
+                workspace_targets: list[tuple[str, str, str]] = []
+                orgs = await client.organizations()
+                if orgs:
+                    for org in orgs.get("organizations", []):
+                        org_id = org.get("orgId")
+
+                        # Remove org with community organisation from the orgs list
+                        # if present
+                        if org_id == "187965850823746":
+                            continue
+
+                        organization_name = org.get("name")
+                        workspaces = (await client.workspaces(org_id)).get(
+                            "workspaces", []
+                        )
 
-    for workflow in workflows:
-        workflow_data = workflow.get("workflow", {})
-        workflow_id = workflow_data.get("id")
+                        for workspace in workspaces:
+                            ws_id = workspace.get("id")
+
+                            # Skip the community/showcase workspace
+                            if ws_id == 40230138858677:
+                                continue
+
+                            ws_name = workspace.get("name")
+
+                            if ws_id is None:
+                                logger.warning(
+                                    "Workspace %s has no ID, skipping", ws_name
+                                )
+                                continue
+
+                            workspace_targets.append(
+                                (organization_name, ws_id, ws_name)
+                            )
+
+                # Bound how many workspaces are processed at once to avoid
+                # overwhelming the Tower API
+                workspace_semaphore = asyncio.Semaphore(8)
+                results = await asyncio.gather(
+                    *[
+                        process_workspace(
+                            client,
+                            ws_id,
+                            min_time,
+                            max_time,
+                            user,
+                            status,
+                            organization_name,
+                            ws_name,
+                            workspace_semaphore,
+                            process_writer,
+                            summary_builder,
+                            page_size,
+                            executor,
+                            fetch_process_metrics,
+                        )
+                        for organization_name, ws_id, ws_name in workspace_targets
+                    ],
+                    return_exceptions=True,
+                )
+
+                for (_organization_name, ws_id, ws_name), result in zip(
+                    workspace_targets, results, strict=True
+                ):
+                    if isinstance(result, BaseException):
+                        logger.error(
+                            "Failed to process workspace %s (%s): %s",
+                            ws_name,
+                            ws_id,
+                            result,
+                        )
 
-        # Get detailed workflow information
-        workflow_details = client.workflow_details(workflow_id, workspace_id)
+    finally:
+        # Stream failures propagate, so release the pool and the
+        # cache connection on every exit path
+        executor.shutdown()
+        if cache is not None:
+            cache.close()
 
-        # Get detailed workflow metrics
-        workflow_metrics_data = client.workflow_metrics(workflow_id, workspace_id)
 
-        if workflow_details and workflow_metrics_data:
-            summary, process_metrics = extract_io_metrics(
-                workflow_details, workflow_metrics_data, org_name, workspace_name
+def display_summary_statistics(df_summary: pl.DataFrame) -> None:
+    """Display summary statistics for the collected IO metrics"""
+    # One multi-threaded group_by pass gives both the per-user rows and
+    # (summed again) the grand totals
+    user_stats = (
+        df_summary.group_by("user_name")
+        .agg(
+            pl.col("total_read_bytes").sum(),
+            pl.col("total_write_bytes").sum(),
+            pl.len().alias("workflow_count"),
+        )
+        .with_columns(
+            (pl.col("total_read_bytes") + pl.col("total_write_bytes")).alias(
+                "total_io_bytes"
             )
-            all_workflow_summaries.append(summary)
-            all_process_metrics.extend(process_metrics)
-            logger.info(f"Collected IO metrics for workflow {workflow_id}")
-
-    return all_workflow_summaries, all_process_metrics
-
+        )
+    )
 
-def display_summary_statistics(df_summary: pd.DataFrame) -> None:
-    """Display summary statistics for the collected IO metrics"""
-    total_workflows = len(df_summary)
-    total_read_bytes = df_summary["total_read_bytes"].sum()
-    total_write_bytes = df_summary["total_write_bytes"].sum()
+    total_workflows = int(user_stats["workflow_count"].sum())
+    # Series.sum() is typed as a numeric union; narrow to float for the
+    # arithmetic and formatting below
+    total_read_bytes = float(user_stats["total_read_bytes"].sum())
+    total_write_bytes = float(user_stats["total_write_bytes"].sum())
     total_io_bytes = total_read_bytes + total_write_bytes
 
-    readable_read = bytes_to_readable(total_read_bytes)
-    readable_write = bytes_to_readable(total_write_bytes)
-    readable_total = bytes_to_readable(total_io_bytes)
-
     typer.echo("\nIO Metrics Summary:")
     typer.echo(f"Total workflows analyzed: {total_workflows}")
-    typer.echo(f"Total read volume: {readable_read}")
-    typer.echo(f"Total write volume: {readable_write}")
-    typer.echo(f"Total IO volume: {readable_total}")
+    typer.echo(f"Total read volume: {bytes_to_readable(total_read_bytes)}")
+    typer.echo(f"Total write volume: {bytes_to_readable(total_write_bytes)}")
+    typer.echo(f"Total IO volume: {bytes_to_readable(total_io_bytes)}")
 
     # Per-user statistics if there are multiple users
-    if len(df_summary["user_name"].unique()) > 1:
+    if user_stats.height > 1:
         typer.echo("\nIO Metrics by User:")
-        user_stats = (
-            df_summary.groupby("user_name")
-            .agg(
-                {
-                    "total_read_bytes": "sum",
-                    "total_write_bytes": "sum",
-                    "workflow_id": "count",
-                }
-            )
-            .reset_index()
+        # Format all byte columns in one vectorized pass
+        read_strs = bytes_to_readable_batch(user_stats["total_read_bytes"].to_numpy())
+        write_strs = bytes_to_readable_batch(user_stats["total_write_bytes"].to_numpy())
+        total_strs = bytes_to_readable_batch(user_stats["total_io_bytes"].to_numpy())
+        for row, read_s, write_s, total_s in zip(
+            user_stats.iter_rows(named=True),
+            read_strs,
+            write_strs,
+            total_strs,
+            strict=True,
+        ):
+            typer.echo(f"User: {row['user_name']}")
+            typer.echo(f"  Workflows: {row['workflow_count']}")
+            typer.echo(f"  Read: {read_s}")
+            typer.echo(f"  Write: {write_s}")
+            typer.echo(f"  Total: {total_s}")
+
+
+# Below this row count the pandas groupby wins; above it the jitted
+# hash-sum over plain arrays is worth the dispatch overhead
+NUMBA_GROUPBY_THRESHOLD = 10_000
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _group_sum(
+        codes: np.ndarray, reads: np.ndarray, writes: np.ndarray, n_groups: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        read_sums = np.zeros(n_groups)
+        write_sums = np.zeros(n_groups)
+        counts = np.zeros(n_groups, np.int64)
+        for i in range(codes.size):
+            k = codes[i]
+            read_sums[k] += reads[i]
+            write_sums[k] += writes[i]
+            counts[k] += 1
+        return read_sums, write_sums, counts
+
+
+def display_summary_statistics_pandas(df_summary: pd.DataFrame) -> None:
+    """Pandas variant of display_summary_statistics for the --use-pandas path"""
+    # One groupby pass gives both the per-user rows and (summed again) the
+    # grand totals, avoiding repeated full-column scans. For very large
+    # frames a numba-jitted hash-sum over factorized user codes beats the
+    # pandas groupby machinery when numba is installed.
+    if njit is not None and len(df_summary) >= NUMBA_GROUPBY_THRESHOLD:
+        codes, uniques = pd.factorize(df_summary["user_name"])
+        read_sums, write_sums, counts = _group_sum(
+            codes.astype(np.int64),
+            df_summary["total_read_bytes"].to_numpy(np.float64),
+            df_summary["total_write_bytes"].to_numpy(np.float64),
+            len(uniques),
         )
-
-        user_stats["total_io_bytes"] = (
-            user_stats["total_read_bytes"] + user_stats["total_write_bytes"]
+        user_stats = pd.DataFrame(
+            {
+                "total_read_bytes": read_sums,
+                "total_write_bytes": write_sums,
+                "workflow_count": counts,
+            },
+            index=pd.Index(uniques, name="user_name"),
         )
-        user_stats = user_stats.rename(columns={"workflow_id": "workflow_count"})
+    else:
+        user_stats = df_summary.groupby("user_name", sort=False, observed=True).agg(
+            total_read_bytes=("total_read_bytes", "sum"),
+            total_write_bytes=("total_write_bytes", "sum"),
+            workflow_count=("workflow_id", "count"),
+        )
+    user_stats["total_io_bytes"] = (
+        user_stats["total_read_bytes"] + user_stats["total_write_bytes"]
+    )
 
-        for _, row in user_stats.iterrows():
-            user = row["user_name"]
-            workflows = row["workflow_count"]
-            read_bytes = bytes_to_readable(row["total_read_bytes"])
-            write_bytes = bytes_to_readable(row["total_write_bytes"])
-            total_bytes = bytes_to_readable(row["total_io_bytes"])
+    total_workflows = int(user_stats["workflow_count"].sum())
+    # Series.sum() is typed as a numeric union; narrow to float for the
+    # arithmetic and formatting below
+    total_read_bytes = float(user_stats["total_read_bytes"].sum())
+    total_write_bytes = float(user_stats["total_write_bytes"].sum())
+    total_io_bytes = total_read_bytes + total_write_bytes
 
-            typer.echo(f"User: {user}")
-            typer.echo(f"  Workflows: {workflows}")
-            typer.echo(f"  Read: {read_bytes}")
-            typer.echo(f"  Write: {write_bytes}")
-            typer.echo(f"  Total: {total_bytes}")
+    typer.echo("\nIO Metrics Summary:")
+    typer.echo(f"Total workflows analyzed: {total_workflows}")
+    typer.echo(f"Total read volume: {bytes_to_readable(total_read_bytes)}")
+    typer.echo(f"Total write volume: {bytes_to_readable(total_write_bytes)}")
+    typer.echo(f"Total IO volume: {bytes_to_readable(total_io_bytes)}")
+
+    # Per-user statistics if there are multiple users
+    if len(user_stats) > 1:
+        typer.echo("\nIO Metrics by User:")
+        # Format all byte columns in one vectorized pass; itertuples avoids
+        # the per-row Series construction of iterrows
+        read_strs = bytes_to_readable_batch(user_stats["total_read_bytes"].to_numpy())
+        write_strs = bytes_to_readable_batch(user_stats["total_write_bytes"].to_numpy())
+        total_strs = bytes_to_readable_batch(user_stats["total_io_bytes"].to_numpy())
+        for row, read_s, write_s, total_s in zip(
+            user_stats.itertuples(), read_strs, write_strs, total_strs, strict=True
+        ):
+            typer.echo(f"User: {row.Index}")
+            typer.echo(f"  Workflows: {row.workflow_count}")
+            typer.echo(f"  Read: {read_s}")
+            typer.echo(f"  Write: {write_s}")
+            typer.echo(f"  Total: {total_s}")
 
 
 @app.command()
@@ -325,6 +1046,43 @@ def main(
             help="API endpoint URL (defaults to environment variable)",
         ),
     ] = None,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Disable the on-disk cache of workflow details/metrics responses",
+        ),
+    ] = False,
+    use_pandas: Annotated[
+        bool,
+        typer.Option(
+            "--use-pandas",
+            help="Use the single-threaded pandas path for aggregation and CSV output",
+        ),
+    ] = False,
+    page_size: Annotated[
+        int,
+        typer.Option(
+            "--page-size",
+            min=1,
+            max=DEFAULT_PAGE_SIZE,
+            help="Workflows fetched per listing request (API maximum is 500)",
+        ),
+    ] = DEFAULT_PAGE_SIZE,
+    process_metrics: Annotated[
+        bool,
+        typer.Option(
+            "--process-metrics/--no-process-metrics",
+            help=(
+                "Fetch per-process metrics; disabling halves the request "
+                "count but leaves the summary byte totals empty"
+            ),
+        ),
+    ] = True,
+    summary_only: Annotated[
+        bool,
+        typer.Option("--summary-only", help="Shortcut for --no-process-metrics"),
+    ] = False,
 ) -> None:
     """Collect IO metrics from Seqera/Tower API for workflows within a date range."""
     if to_date is None:
@@ -351,99 +1109,59 @@ def main(
         + "Z"
     )
 
-    client = APIClient(base_url, api_key)
-    all_workflow_summaries = []
-    all_process_metrics = []
-
-    # If workspace ID is provided, only process that workspace
-    if workspace_id:
-        logger.info(f"Processing only workspace ID: {workspace_id}")
-        # We need to find the workspace name and org name
-        org_name = "Unknown"
-        workspace_name = "Unknown"
-
-        orgs = client.organizations()
-        if orgs:
-            for org in orgs.get("organizations", []):
-                org_id = org.get("orgId")
-                workspaces = client.workspaces(org_id).get("workspaces", [])
-                for workspace in workspaces:
-                    if workspace.get("id") == workspace_id:
-                        org_name = org.get("name")
-                        workspace_name = workspace.get("name")
-                        break
-                if workspace_name != "Unknown":
-                    break
-
-        summaries, process_metrics = process_workspace(
-            client,
-            workspace_id,
-            min_time,
-            max_time,
-            user,
-            status,
-            org_name,
-            workspace_name,
+    fetch_process_metrics = process_metrics and not summary_only
+
+    # Process-level rows stream straight to disk as workflows complete and
+    # summaries accumulate column-wise, so no row-oriented intermediate is
+    # ever materialized
+    process_output = f"process_{output}"
+    process_writer = ProcessMetricsWriter(process_output)
+    summary_builder = SummaryBuilder()
+    try:
+        asyncio.run(
+            collect_io_metrics(
+                base_url,
+                api_key,
+                min_time,
+                max_time,
+                workspace_id,
+                user,
+                status,
+                no_cache,
+                process_writer,
+                summary_builder,
+                page_size,
+                fetch_process_metrics,
+            )
         )
-        all_workflow_summaries.extend(summaries)
-        all_process_metrics.extend(process_metrics)
-    else:
-        # Iterate over all organizations and workspaces
-        orgs = client.organizations()
-        if orgs:
-            for org in orgs.get("organizations", []):
-                org_id = org.get("orgId")
-
-                # Remove org with community organisation from the orgs list if present
-                if org_id == "187965850823746":
-                    continue
+    finally:
+        process_writer.close()
 
-                organization_name = org.get("name")
-                workspaces = client.workspaces(org_id).get("workspaces", [])
-
-                for workspace in workspaces:
-                    workspace_id = workspace.get("id")
-
-                    # Skip the community/showcase workspace
-                    if workspace_id == 40230138858677:
-                        continue
-
-                    workspace_name = workspace.get("name")
-
-                    if workspace_id is None:
-                        logger.warning(
-                            f"Workspace {workspace_name} has no ID, skipping"
-                        )
-                        continue
-
-                    summaries, process_metrics = process_workspace(
-                        client,
-                        workspace_id,
-                        min_time,
-                        max_time,
-                        user,
-                        status,
-                        organization_name,
-                        workspace_name,
-                    )
-                    all_workflow_summaries.extend(summaries)
-                    all_process_metrics.extend(process_metrics)
-
-    if all_workflow_summaries:
-        df_summary = pd.DataFrame(all_workflow_summaries)
+    if summary_builder.rows:
         summary_output = output
-        df_summary.to_csv(summary_output, index=False)
-        logger.info(f"Workflow summary IO metrics saved to {summary_output}")
-
-        # Save process-level metrics to a separate file if there are any
-        if all_process_metrics:
-            process_output = f"process_{output}"
-            df_processes = pd.DataFrame(all_process_metrics)
-            df_processes.to_csv(process_output, index=False)
-            logger.info(f"Process-level IO metrics saved to {process_output}")
-
-        # Display summary statistics
-        display_summary_statistics(df_summary)
+        if use_pandas:
+            df_summary_pd = summary_builder.to_pandas()
+            df_summary_pd.to_csv(summary_output, index=False)
+        else:
+            # polars writes CSV and aggregates with a multi-threaded engine
+            df_summary = summary_builder.to_polars()
+            df_summary.write_csv(summary_output)
+        logger.info("Workflow summary IO metrics saved to %s", summary_output)
+
+        if process_writer.rows_written:
+            logger.info("Process-level IO metrics saved to %s", process_output)
+
+        # Display summary statistics; without the metrics payloads the byte
+        # totals are unknown, so only report the workflow count
+        if not fetch_process_metrics:
+            typer.echo(
+                f"\nCollected {summary_builder.rows} workflow summaries "
+                "(process metrics skipped)"
+            )
+        elif use_pandas:
+            display_summary_statistics_pandas(df_summary_pd)
+        else:
+            display_summary_statistics(df_summary)
     else:
         logger.warning("No workflow data collected")
         typer.echo("No workflow data collected. Check your filters or date range.")